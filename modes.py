@@ -9,7 +9,8 @@ behaviour—it only formalizes constants that already existed elsewhere.
 from __future__ import annotations
 
 from enum import Enum
-from typing import Dict, Iterable, Mapping
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
 
 
 class Mode(str, Enum):
@@ -29,10 +30,10 @@ class Mode(str, Enum):
     def from_value(cls, value: str) -> "Mode":
         """Normalize a string into a ``Mode`` instance."""
 
-        try:
-            return cls(value)
-        except ValueError as exc:  # pragma: no cover - defensive guard
-            raise ValueError(f"Unsupported mode: {value}") from exc
+        mode = _VALUE_TO_MODE.get(value)
+        if mode is None:  # pragma: no cover - defensive guard
+            raise ValueError(f"Unsupported mode: {value}")
+        return mode
 
     @property
     def ui_label(self) -> str:
@@ -41,10 +42,13 @@ class Mode(str, Enum):
         return MODE_DISPLAY_LABELS[self]
 
 
+# Direct value lookup so ``Mode.from_value`` skips the enum call machinery.
+_VALUE_TO_MODE: Dict[str, Mode] = {mode.value: mode for mode in Mode}
+
 DEFAULT_MODE: Mode = Mode.STANDARD
 
 # Order that communicates the "agreeability" scale left-to-right.
-MODE_UI_ORDER: Iterable[Mode] = (
+MODE_UI_ORDER: Tuple[Mode, ...] = (
     Mode.AGREE,
     Mode.FRIENDLY,
     Mode.STANDARD,
@@ -52,13 +56,13 @@ MODE_UI_ORDER: Iterable[Mode] = (
     Mode.FACT_CHECK,
 )
 
-MODE_DISPLAY_LABELS: Mapping[Mode, str] = {
+MODE_DISPLAY_LABELS: Mapping[Mode, str] = MappingProxyType({
     Mode.AGREE: "Agree ✅",
     Mode.FRIENDLY: "Friendly 🤝",
     Mode.STANDARD: "Standard 💼",
     Mode.DUNK: "Dunk 🏀",
     Mode.FACT_CHECK: "Fact Check 🔍",
-}
+})
 
 
 # Placeholders we expect to swap out inside ``llm_prompt.txt``.
@@ -72,7 +76,7 @@ PROMPT_PLACEHOLDERS = (
 )
 
 
-BASE_PROMPT_CONFIG: Mapping[str, str] = {
+BASE_PROMPT_CONFIG: Mapping[str, str] = MappingProxyType({
     "STANCE": (
         "You are Misc1, taking a politically conservative stance on the issue being "
         "argued. You're here to disagree and present a counter-perspective. Factual "
@@ -113,11 +117,11 @@ BASE_PROMPT_CONFIG: Mapping[str, str] = {
         "Set your target length: approximately the same length, or at most 1-2 "
         "sentences longer"
     ),
-}
+})
 
 
-MODE_PROMPT_OVERRIDES: Mapping[Mode, Mapping[str, str]] = {
-    Mode.FRIENDLY: {
+MODE_PROMPT_OVERRIDES: Mapping[Mode, Mapping[str, str]] = MappingProxyType({
+    Mode.FRIENDLY: MappingProxyType({
         "TONE": (
             "FRIENDLY MODE: Sound calm, personable, and genuinely respectful while you "
             "push back. Think friendly debate over coffee—acknowledge what they value, "
@@ -125,8 +129,8 @@ MODE_PROMPT_OVERRIDES: Mapping[Mode, Mapping[str, str]] = {
             "human, but remain confident, unwavering, and focused on changing their mind, "
             "not conceding ground."
         ),
-    },
-    Mode.DUNK: {
+    }),
+    Mode.DUNK: MappingProxyType({
         "TONE": (
             "DUNK MODE: Be ruthless, cutting, and mercilessly critical. Call out weak "
             "reasoning, expose logical fallacies by name, and demolish their argument "
@@ -135,8 +139,8 @@ MODE_PROMPT_OVERRIDES: Mapping[Mode, Mapping[str, str]] = {
             "The goal is to completely dismantle their argument and make them regret "
             "engaging. This is a debate, and you're here to win decisively."
         ),
-    },
-    Mode.AGREE: {
+    }),
+    Mode.AGREE: MappingProxyType({
         "STANCE": (
             "AGREE MODE: You are aligned with the final commenter while staying true to "
             "Misc1's core identity and non-negotiable beliefs. Reinforce their points, add "
@@ -173,8 +177,8 @@ MODE_PROMPT_OVERRIDES: Mapping[Mode, Mapping[str, str]] = {
             "Set your target length to roughly match the original comment, with "
             "permission to go up to about 150% if that's helpful for reinforcement"
         ),
-    },
-    Mode.FACT_CHECK: {
+    }),
+    Mode.FACT_CHECK: MappingProxyType({
         "STANCE": (
             "FACT CHECK MODE: You are a conservative researcher conducting a critical review "
             "of a Reddit post to determine if the title accurately reflects the linked content. "
@@ -224,19 +228,36 @@ MODE_PROMPT_OVERRIDES: Mapping[Mode, Mapping[str, str]] = {
             "Your analysis should be as detailed as needed to thoroughly document your findings, "
             "typically 3-6 paragraphs with specific evidence and quotes"
         ),
-    },
-}
+    }),
+})
+
+
+def _build_prompt_configs() -> Dict[Mode, Mapping[str, str]]:
+    """Merge the base config with each mode's overrides and validate once."""
+
+    configs: Dict[Mode, Mapping[str, str]] = {}
+    for mode in Mode:
+        config = {**BASE_PROMPT_CONFIG, **MODE_PROMPT_OVERRIDES.get(mode, {})}
 
+        missing_keys = {key for key in PROMPT_PLACEHOLDERS if key not in config}
+        if missing_keys:  # pragma: no cover - defensive (should never trigger)
+            raise KeyError(
+                f"Prompt config for {mode.value} missing keys: {sorted(missing_keys)}"
+            )
 
-def get_prompt_config(mode: Mode) -> Dict[str, str]:
-    """Return the mapping of template placeholders for ``mode``."""
+        configs[mode] = MappingProxyType(config)
+    return configs
 
-    config = dict(BASE_PROMPT_CONFIG)
-    overrides = MODE_PROMPT_OVERRIDES.get(mode, {})
-    config.update(overrides)
 
-    missing_keys = {key for key in PROMPT_PLACEHOLDERS if key not in config}
-    if missing_keys:  # pragma: no cover - defensive (should never trigger)
-        raise KeyError(f"Prompt config missing keys: {sorted(missing_keys)}")
+# The base config and overrides never change at runtime, so merge them once.
+_PROMPT_CONFIGS: Dict[Mode, Mapping[str, str]] = _build_prompt_configs()
+
+
+def get_prompt_config(mode: Mode) -> Mapping[str, str]:
+    """Return the mapping of template placeholders for ``mode``.
+
+    The result is a shared read-only view; wrap it in ``dict(...)`` if you
+    need to modify it.
+    """
 
-    return config
+    return _PROMPT_CONFIGS[mode]
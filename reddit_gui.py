@@ -1,19 +1,224 @@
 import tkinter as tk
-import pyperclip
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+from itertools import islice
+import os
+import re
+import sys
+import traceback
 
 from modes import DEFAULT_MODE, MODE_UI_ORDER
-from scraper_utils import get_comment_chain
+from scraper_utils import build_conversation, close_session, fetch_comment_thread
 
 
+# Clipboard text must look like a Reddit post/comment link to be processed
+# Permalinks fetch_comment_thread can turn into a .json URL, with or without the
+# /r/<sub> prefix (e.g. old.reddit.com/comments/<id>). Share links (/s/<id>,
+# redd.it) only redirect to a permalink, so they are not accepted.
+REDDIT_URL_RE = re.compile(r'https?://(?:[\w-]+\.)?reddit\.com/(?:r/[^/]+/)?comments/', re.IGNORECASE)
+MAX_URL_LENGTH = 4096
+
+# Echo a preview of each fetched chain to the terminal
+VERBOSE = True
+PREVIEW_COMMENT_LIMIT = 20  # comments echoed to the console per fetch
+
 # Store the processed conversation and URL globally
 last_conversation = None
-last_url = None
+last_thread = None  # Raw Reddit thread behind last_conversation
+last_mode = None  # Mode last_conversation was rendered with
+last_full_text = None  # last_conversation joined for the clipboard
+
+# Widgets created by build_ui(); the handlers below read them from here
+root = None
+mode_var = None
+auto_submit_var = None
+mode_buttons = []
+gemini_button = None
+grok_button = None
+status_label = None
+last_status = None  # (text, fg) currently shown in status_label
+actions_enabled = False  # whether the Gemini/Grok buttons have been enabled
+
+# True while a paste is being fetched so repeated pastes don't pile up
+fetch_in_flight = False
+# Set by on_close so late fetch results don't touch the destroyed window
+closing = False
+
+# Single background worker so Reddit requests never block the Tk event loop
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+GEMINI_URL = "https://gemini.google.com"
+GROK_URL = "https://grok.com"
+
+# True once the page at {url} has loaded and its chat box holds focus; focuses
+# the box itself if the site hasn't yet. Single quotes only, since it is
+# embedded in an AppleScript string.
+PAGE_READY_JS = (
+    "(function () {{"
+    " if (location.href.indexOf('{url}') !== 0 || document.readyState !== 'complete') return false;"
+    " var box = document.querySelector('[contenteditable=true], textarea');"
+    " if (!box) return false;"
+    " box.focus();"
+    " return document.activeElement === box;"
+    " }})()"
+)
+
+# Opens a new Safari tab at {url}, waits for it to load (checking it with
+# {ready_js}, PAGE_READY_JS, where allowed), and pastes the clipboard; {submit} is SUBMIT_KEYSTROKE when auto-submit is enabled,
+# otherwise empty. Errors out without pasting if the page never loads (e.g.
+# a logged-out redirect to the sign-in page).
+SAFARI_APPLESCRIPT = '''
+tell application "Safari"
+    activate
+    if (count of windows) = 0 then
+        make new document
+    else
+        tell front window
+            set current tab to (make new tab)
+        end tell
+    end if
+    set URL of front document to "{url}"
+    -- Wait (up to ~5s) for the page. With Safari's Develop > Allow JavaScript
+    -- from Apple Events on, the page check also waits for its chat box to
+    -- take focus; otherwise a real page title is taken as loaded.
+    set pageReady to false
+    set byTitle to false
+    repeat 50 times
+        delay 0.1
+        set pageURL to ""
+        set pageName to ""
+        try
+            set pageURL to URL of front document
+            set pageName to name of front document
+        end try
+        if pageURL starts with "{url}" then
+            try
+                set pageReady to ((do JavaScript "{ready_js}" in front document) is true)
+                set byTitle to false
+            on error -- JavaScript not allowed, or the page is mid-navigation
+                set byTitle to true
+                set pageReady to not (pageName is "" or pageName is "Untitled" or pageName starts with "http")
+            end try
+        end if
+        if pageReady then exit repeat
+    end repeat
+    if not pageReady then error "{url} did not finish loading; nothing was pasted"
+    if byTitle then delay 0.5 -- let the editor finish attaching its paste handlers
+end tell
+
+tell application "System Events"
+    tell process "Safari"
+        keystroke "v" using command down{submit}
+    end tell
+end tell
+'''
+
+SUBMIT_KEYSTROKE = '''
+        delay 0.2
+        key code 36 -- return key to send the message'''
+
+# How often to check whether a launched AppleScript has finished
+OSASCRIPT_POLL_MS = 250
+
+# How often to look for a newly copied Reddit link to prefetch; the interval
+# doubles every few unchanged polls up to the ceiling while nothing is copied
+CLIPBOARD_POLL_MS = 500
+CLIPBOARD_POLL_MAX_MS = 4000
+last_clipboard = None  # clipboard text seen by the last poll
+clipboard_idle_polls = 0  # consecutive polls that saw the same text
+clipboard_poll_id = None  # pending root.after id, cancelled on close
+
+# Compiled copies of the Safari scripts (macOS only), so osascript skips parsing them
+APPLESCRIPT_CACHE_DIR = os.path.expanduser("~/Library/Caches/RedditCommenter")
+compiles_in_flight = set()  # cache paths with an osacompile still running
+
+
+def load_conversation(url, mode):
+    """Fetch the thread for ``url`` and render it for ``mode``.
+
+    Runs on the fetch worker; returns ``(thread, conversation)``.
+    """
+    thread = fetch_comment_thread(url)
+    return thread, build_conversation(thread, mode=mode)
+
+
+def _set_status(text, fg):
+    """Update the status label in one configure call, skipping no-op updates.
+
+    ``wraplength`` is fixed when the label is built, so only the text and
+    colour change here.
+    """
+    global last_status
+    if (text, fg) == last_status:
+        return
+    last_status = (text, fg)
+    status_label.config(text=text, fg=fg)
+
+
+def _enable_action_buttons():
+    """Enable the Gemini/Grok buttons; they stay enabled once a chain is loaded."""
+    global actions_enabled
+    if actions_enabled:
+        return
+    actions_enabled = True
+    gemini_button.config(state="normal", bg="#1a73e8", fg="white")
+    grok_button.config(state="normal", bg="#0068ff", fg="white")
+
+
+def _set_clipboard(text):
+    """Put ``text`` on the clipboard through Tk, without spawning ``pbcopy``.
+
+    Events are deliberately not processed here: callers are Tk callbacks, and
+    a nested ``update()`` could run ``on_close`` or another paste mid-handler.
+    ``osascript`` is started without waiting, so Tk is back in its main loop
+    to serve the new contents before Safari receives ⌘V.
+    """
+    root.clipboard_clear()
+    root.clipboard_append(text)
+
+
+def poll_clipboard():
+    """Start fetching a Reddit link as soon as it is copied.
+
+    The result lands in the thread cache, so the ⌘+V that follows usually
+    renders without waiting on the network.
+    """
+    global last_clipboard, clipboard_poll_id, clipboard_idle_polls
+    try:
+        text = root.clipboard_get().strip()
+    except tk.TclError:  # Empty or non-text clipboard
+        text = ""
+
+    if text != last_clipboard:
+        last_clipboard = text
+        clipboard_idle_polls = 0
+        if len(text) <= MAX_URL_LENGTH and REDDIT_URL_RE.match(text):
+            print(f"Prefetching copied link: {text}")
+            _FETCH_EXECUTOR.submit(fetch_comment_thread, text)
+    else:
+        clipboard_idle_polls += 1
+
+    delay = min(CLIPBOARD_POLL_MAX_MS, CLIPBOARD_POLL_MS << min(clipboard_idle_polls // 4, 3))
+    clipboard_poll_id = root.after(delay, poll_clipboard)
+
+
+def wake_clipboard_poll(event=None):
+    """Poll right away when the window gains focus after a backed-off wait.
+
+    Copying a link usually happens in another app, so regaining focus is
+    the moment a new link is most likely to be waiting.
+    """
+    global clipboard_idle_polls
+    if clipboard_idle_polls < 4 or clipboard_poll_id is None:  # Not backed off yet
+        return
+    root.after_cancel(clipboard_poll_id)
+    clipboard_idle_polls = 0
+    poll_clipboard()
 
 
 def handle_paste(event=None):
     """Handle CMD+V paste event and process the URL from clipboard."""
-    global last_conversation, last_url
+    global fetch_in_flight
     try:
         # Get URL from clipboard
         url = root.clipboard_get().strip()
@@ -21,46 +226,78 @@ def handle_paste(event=None):
         print(f"URL: {url}")
 
         if not url:
-            status_label.config(text="Clipboard is empty", fg="orange", wraplength=350)
+            _set_status("Clipboard is empty", "orange")
             return "break"  # Prevent default paste behavior
 
-        if 'reddit.com' not in url:
-            status_label.config(text="Not a Reddit link", fg="orange", wraplength=350)
+        # Real comment links are short; anything huge is stray clipboard content
+        if len(url) > MAX_URL_LENGTH or not REDDIT_URL_RE.match(url):
+            _set_status("Not a Reddit comment permalink (share links: open in a browser first)", "orange")
+            return "break"
+
+        # Key repeat or impatient re-pastes shouldn't stack up fetches
+        if fetch_in_flight:
+            print("Fetch already in progress, ignoring paste")
             return "break"
 
         # Show processing message
-        status_label.config(text="Processing...", fg="blue", wraplength=350)
-        root.update()
+        _set_status("Processing...", "blue")
         print("Fetching comment chain...")
 
-        # Store the URL for later mode changes
-        last_url = url
-
         # Get selected mode
         mode = mode_var.get()
         print(f"Mode: {mode}")
 
-        # Get the comment chain
-        conversation = get_comment_chain(url, mode=mode)
-        last_conversation = conversation  # Store for later use
-        full_text = '\n\n'.join(conversation)
+        # Fetch on the worker thread and hand the result back to the Tk loop
+        fetch_in_flight = True
+        future = _FETCH_EXECUTOR.submit(load_conversation, url, mode)
+        future.add_done_callback(lambda f: _hand_back_result(f, mode))
 
-        # Print preview
-        print(f"\n=== CONVERSATION PREVIEW ===")
-        comments = conversation[3:]  # Skip instructions, post, and "COMMENT SECTION:" header
-        print(f"Post + {len(comments)} comments in chain")
-        for i, comment in enumerate(comments):
-            preview = comment[:80] + "..." if len(comment) > 80 else comment
-            print(f"{i+1}. {preview}")
+        return "break"  # Prevent default paste behavior
 
-        print(f"\n=== TOTAL: {len(conversation)} items ===")
+    except tk.TclError:
+        _set_status("Clipboard is empty", "orange")
+        return "break"
+    except Exception as e:
+        print(f"ERROR: {e}")
+        traceback.print_exc()
+        _set_status(f"✗ Error: {str(e)}", "red")
+        return "break"
 
-        # Copy full conversation to clipboard
-        pyperclip.copy(full_text)
-        print("✓ Copied to clipboard!")
 
-        # Get last comment for display
-        last_comment = comments[-1] if comments else "No comments found"
+def _hand_back_result(future, mode):
+    """Schedule ``_apply_comment_chain`` on the Tk loop; runs on the worker."""
+    global fetch_in_flight
+    if closing:
+        return
+    try:
+        root.after(0, _apply_comment_chain, future, mode)
+    except (RuntimeError, tk.TclError) as e:
+        if closing:  # Window went away after the check
+            return
+        # The result can't reach the Tk loop; free the next paste instead of
+        # leaving it ignored as "already in progress"
+        print(f"ERROR: could not hand fetch result to the UI: {e}")
+        traceback.print_exc()
+        fetch_in_flight = False
+
+
+def _apply_comment_chain(future, mode):
+    """Show the result of a background fetch started by ``handle_paste``.
+
+    Runs on the Tk thread via ``root.after`` so it can touch widgets safely.
+    """
+    global last_conversation, last_thread, last_mode, last_full_text, fetch_in_flight
+    fetch_in_flight = False
+    try:
+        # Get the comment chain
+        thread, conversation = future.result()
+        last_thread = thread  # Kept so mode changes re-render without refetching
+        last_conversation = conversation  # Store for later use
+        last_mode = mode
+        last_full_text = '\n\n'.join(conversation)
+
+        # Get last comment for display (items 0-2 are instructions, post, header)
+        last_comment = conversation[-1] if len(conversation) > 3 else "No comments found"
 
         # Truncate last comment for display
         if len(last_comment) > 150:
@@ -68,297 +305,370 @@ def handle_paste(event=None):
         else:
             display_text = last_comment
 
+        # Print preview in one write rather than a print per comment
+        if VERBOSE:
+            # Skip instructions, post, and "COMMENT SECTION:" header without copying the list
+            comment_count = len(conversation) - 3
+            comments = islice(conversation, 3, 3 + PREVIEW_COMMENT_LIMIT)
+            lines = ["\n=== CONVERSATION PREVIEW ===", f"Post + {comment_count} comments in chain"]
+            lines.extend(
+                f"{i}. {comment[:80] + '...' if len(comment) > 80 else comment}"
+                for i, comment in enumerate(comments, 1)
+            )
+            if comment_count > PREVIEW_COMMENT_LIMIT:
+                lines.append(f"... ({comment_count - PREVIEW_COMMENT_LIMIT} more comments)")
+            lines.append(f"\n=== TOTAL: {len(conversation)} items ===")
+            sys.stdout.write("\n".join(lines) + "\n")
+
+        # Copy full conversation to clipboard
+        _set_clipboard(last_full_text)
+        print("✓ Copied to clipboard!")
+
         # Show success message with last comment preview
         success_msg = f"✓ Success! Last comment:\n\n{display_text}"
-        status_label.config(text=success_msg, fg="green", wraplength=350)
-
-        # Enable the action buttons
-        gemini_button.config(state="normal", bg="#1a73e8", fg="white")
-        grok_button.config(state="normal", bg="#0068ff", fg="white")
+        _set_status(success_msg, "green")
 
-        return "break"  # Prevent default paste behavior
+        _enable_action_buttons()
 
-    except tk.TclError:
-        status_label.config(text="Clipboard is empty", fg="orange", wraplength=350)
-        return "break"
     except Exception as e:
         print(f"ERROR: {e}")
-        import traceback
         traceback.print_exc()
-        status_label.config(text=f"✗ Error: {str(e)}", fg="red", wraplength=350)
-        return "break"
+        _set_status(f"✗ Error: {str(e)}", "red")
 
 
 def regenerate_conversation():
-    """Regenerate the conversation with the current mode selection."""
-    global last_conversation, last_url
+    """Return the conversation text for the current mode selection.
 
-    if not last_url:
-        return
+    The last fetched thread is only re-rendered if the mode has changed.
+    """
+    global last_conversation, last_mode, last_full_text
+
+    if not last_thread:
+        return None
 
     mode = mode_var.get()
+    if mode == last_mode:
+        return last_full_text
+
     print(f"\n=== REGENERATING with mode: {mode} ===")
 
-    # Regenerate conversation with new mode
-    conversation = get_comment_chain(last_url, mode=mode)
+    # Re-render the already fetched thread with the new mode (no network)
+    conversation = build_conversation(last_thread, mode=mode)
     last_conversation = conversation
+    last_mode = mode
+    last_full_text = '\n\n'.join(conversation)
+    print(f"✓ Regenerated with {mode} mode")
+    return last_full_text
 
-    # Update clipboard
-    full_text = '\n\n'.join(conversation)
-    pyperclip.copy(full_text)
-    print(f"✓ Regenerated and copied to clipboard with {mode} mode")
 
+def _compiled_script_path(applescript):
+    """Return the cache path for the compiled form of ``applescript``."""
+    digest = hashlib.sha1(applescript.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(APPLESCRIPT_CACHE_DIR, f"{digest}.scpt")
 
-def open_gemini():
-    """Open Safari, navigate to Gemini, and paste the conversation."""
-    global last_conversation
 
-    if not last_conversation:
-        status_label.config(text="No conversation to send to Gemini", fg="orange", wraplength=350)
+def _start_compile(applescript, compiled_path):
+    """Compile ``applescript`` in the background for later runs (macOS only).
+
+    ``osacompile`` writes to a temporary file next to ``compiled_path``, which
+    is moved into place only after a clean exit, so a half-written or failed
+    compile is never picked up.
+    """
+    import subprocess  # Deferred: only needed when opening Safari
+
+    if sys.platform != 'darwin' or compiled_path in compiles_in_flight:
         return
 
+    tmp_path = f"{compiled_path[:-len('.scpt')]}.{os.getpid()}.tmp.scpt"
     try:
-        # Regenerate conversation with current mode before opening Gemini
-        regenerate_conversation()
+        os.makedirs(APPLESCRIPT_CACHE_DIR, exist_ok=True)
+        proc = subprocess.Popen(
+            ['osacompile', '-o', tmp_path, '-e', applescript],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError as e:  # Caching is best effort; the source run still works
+        print(f"Could not cache compiled AppleScript: {e}")
+        return
 
-        # Copy conversation to clipboard for pasting
-        full_text = '\n\n'.join(last_conversation)
-        pyperclip.copy(full_text)
+    compiles_in_flight.add(compiled_path)
+    root.after(OSASCRIPT_POLL_MS, _finish_compile, proc, tmp_path, compiled_path)
 
-        # Build AppleScript based on auto-submit setting
-        auto_submit = auto_submit_var.get()
-
-        if auto_submit:
-            paste_and_submit = '''
-            tell application "System Events"
-                tell process "Safari"
-                    keystroke "v" using command down
-                    delay 0.2
-                    key code 36 -- return key to send the message
-                end tell
-            end tell
-            '''
-        else:
-            paste_and_submit = '''
-            tell application "System Events"
-                tell process "Safari"
-                    keystroke "v" using command down
-                end tell
-            end tell
-            '''
-
-        applescript = f'''
-        tell application "Safari"
-            activate
-            if (count of windows) = 0 then
-                make new document
-            else
-                tell front window
-                    set current tab to (make new tab)
-                end tell
-            end if
-            delay 0.5
-            set URL of front document to "https://gemini.google.com"
-            delay 2
-        end tell
 
-        {paste_and_submit}
-        '''
+def _finish_compile(proc, tmp_path, compiled_path):
+    """Publish a finished background compile, or discard it if it failed."""
+    if proc.poll() is None:
+        root.after(OSASCRIPT_POLL_MS, _finish_compile, proc, tmp_path, compiled_path)
+        return
 
-        subprocess.run(['osascript', '-e', applescript], check=True)
-        print("✓ Opened Gemini in Safari and pasted conversation")
-        status_label.config(text="✓ Opened Gemini in Safari", fg="blue", wraplength=350)
+    compiles_in_flight.discard(compiled_path)
+    try:
+        if proc.returncode == 0:
+            os.replace(tmp_path, compiled_path)
+        elif os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    except OSError as e:
+        print(f"Could not cache compiled AppleScript: {e}")
 
-    except Exception as e:
-        print(f"ERROR opening Gemini: {e}")
-        import traceback
-        traceback.print_exc()
-        status_label.config(text=f"✗ Error opening Gemini: {str(e)}", fg="red", wraplength=350)
 
+def _load_compiled_script(compiled_path):
+    """Return ``compiled_path`` if osascript can load it, otherwise ``None``.
 
-def open_grok():
-    """Open Safari, navigate to Grok, and paste the conversation."""
-    global last_conversation
+    An empty or unreadable cache file (e.g. left by an interrupted cache
+    clean-up) is removed so the next compile can replace it.
+    """
+    try:
+        if os.path.getsize(compiled_path) > 0 and os.access(compiled_path, os.R_OK):
+            return compiled_path
+    except OSError:  # Not compiled yet
+        return None
+    try:
+        os.remove(compiled_path)
+    except OSError:
+        pass
+    return None
+
+
+def run_applescript(applescript, service):
+    """Start ``osascript`` without blocking the Tk loop; report the outcome later.
+
+    The first run of a given script is passed as source and compiled in the
+    background with ``osacompile``; later runs load the compiled ``.scpt``.
+    """
+    import subprocess  # Deferred: only needed when opening Safari
+
+    cache_path = _compiled_script_path(applescript)
+    compiled_path = _load_compiled_script(cache_path)
+    if compiled_path is not None:
+        command = ['osascript', compiled_path]
+    else:
+        command = ['osascript', '-e', applescript]
+        _start_compile(applescript, cache_path)
+
+    proc = subprocess.Popen(
+        command,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    _set_status(f"Opening {service} in Safari...", "blue")
+    root.after(OSASCRIPT_POLL_MS, _check_applescript, proc, service)
+
+
+def _check_applescript(proc, service):
+    """Poll a running ``osascript`` and update the status once it exits.
 
+    A failed run is only reported, never retried: the script has usually
+    opened a tab or pasted by the time it fails, and the cached ``.scpt`` is
+    keyed by the source, so it can't be the stale cause.
+    """
+    if proc.poll() is None:
+        root.after(OSASCRIPT_POLL_MS, _check_applescript, proc, service)
+        return
+
+    if proc.returncode == 0:
+        print(f"✓ Opened {service} in Safari and pasted conversation")
+        _set_status(f"✓ Opened {service} in Safari", "blue")
+        return
+
+    error = proc.stderr.read().strip() or f"osascript exited with {proc.returncode}"
+    print(f"ERROR opening {service}: {error}")
+    _set_status(f"✗ Error opening {service}: {error}", "red")
+
+
+def open_in_safari(service, url):
+    """Open Safari, navigate to ``url``, and paste the conversation."""
     if not last_conversation:
-        status_label.config(text="No conversation to send to Grok", fg="orange", wraplength=350)
+        _set_status(f"No conversation to send to {service}", "orange")
         return
 
     try:
-        regenerate_conversation()
-
-        full_text = '\n\n'.join(last_conversation)
-        pyperclip.copy(full_text)
+        # Regenerate with the current mode and copy it once for pasting
+        _set_clipboard(regenerate_conversation())
 
         # Build AppleScript based on auto-submit setting
-        auto_submit = auto_submit_var.get()
-
-        if auto_submit:
-            paste_and_submit = '''
-            tell application "System Events"
-                tell process "Safari"
-                    keystroke "v" using command down
-                    delay 0.2
-                    key code 36 -- return key to send the message
-                end tell
-            end tell
-            '''
-        else:
-            paste_and_submit = '''
-            tell application "System Events"
-                tell process "Safari"
-                    keystroke "v" using command down
-                end tell
-            end tell
-            '''
-
-        applescript = f'''
-        tell application "Safari"
-            activate
-            if (count of windows) = 0 then
-                make new document
-            else
-                tell front window
-                    set current tab to (make new tab)
-                end tell
-            end if
-            delay 0.5
-            set URL of front document to "https://grok.com"
-            delay 2
-        end tell
-
-        {paste_and_submit}
-        '''
+        submit = SUBMIT_KEYSTROKE if auto_submit_var.get() else ""
+        applescript = SAFARI_APPLESCRIPT.format(
+            url=url, ready_js=PAGE_READY_JS.format(url=url), submit=submit
+        )
 
-        subprocess.run(['osascript', '-e', applescript], check=True)
-        print("✓ Opened Grok in Safari and pasted conversation")
-        status_label.config(text="✓ Opened Grok in Safari", fg="blue", wraplength=350)
+        run_applescript(applescript, service)
 
     except Exception as e:
-        print(f"ERROR opening Grok: {e}")
-        import traceback
+        print(f"ERROR opening {service}: {e}")
         traceback.print_exc()
-        status_label.config(text=f"✗ Error opening Grok: {str(e)}", fg="red", wraplength=350)
-
-
-# Create the main window
-root = tk.Tk()
-root.title("Reddit Comment Scraper")
-root.geometry("500x310")
-root.resizable(False, False)
-root.config(bg="#1e1e1e")
-
-# Create and pack widgets
-title_label = tk.Label(
-    root,
-    text="Reddit Comment Chain Scraper",
-    font=("Arial", 14, "bold"),
-    bg="#1e1e1e",
-    fg="#ffffff"
-)
-title_label.pack(pady=(20, 10))
-
-instruction_label = tk.Label(
-    root,
-    text="Press ⌘+V to paste Reddit comment URL",
-    font=("Arial", 11),
-    bg="#1e1e1e",
-    fg="#cccccc"
-)
-instruction_label.pack(pady=5)
-
-# Mode selection with radio buttons
-mode_var = tk.StringVar(value=DEFAULT_MODE.value)
-
-mode_frame = tk.Frame(root, bg="#1e1e1e")
-mode_frame.pack(pady=10)
-
-# Auto-submit toggle
-auto_submit_var = tk.BooleanVar(value=True)
-auto_submit_checkbox = tk.Checkbutton(
-    root,
-    text="Auto-submit with Return key",
-    variable=auto_submit_var,
-    font=("Arial", 10),
-    bg="#1e1e1e",
-    fg="#cccccc",
-    selectcolor="#2d2d2d",
-    activebackground="#1e1e1e",
-    activeforeground="#ffffff"
-)
-auto_submit_checkbox.pack(pady=5)
+        _set_status(f"✗ Error opening {service}: {str(e)}", "red")
 
-# Keep references alive mainly for future customisation (tooltips, styling).
-mode_buttons = []
-for mode in MODE_UI_ORDER:
-    button = tk.Radiobutton(
-        mode_frame,
-        text=mode.ui_label,
-        variable=mode_var,
-        value=mode.value,
+
+def open_gemini():
+    """Open Safari, navigate to Gemini, and paste the conversation."""
+    open_in_safari("Gemini", GEMINI_URL)
+
+
+def open_grok():
+    """Open Safari, navigate to Grok, and paste the conversation."""
+    open_in_safari("Grok", GROK_URL)
+
+
+def on_close():
+    """Stop background work and close the window.
+
+    The HTTP session is closed by ``main`` once the fetch worker has finished,
+    so an in-flight request isn't cut off underneath it.
+    """
+    global closing
+    closing = True
+    if clipboard_poll_id is not None:
+        root.after_cancel(clipboard_poll_id)
+    # Drop queued prefetches; a fetch already running finishes on its own
+    _FETCH_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    root.destroy()
+
+
+def build_ui():
+    """Create the main window and widgets, and bind the paste shortcut.
+
+    Kept out of import time so the handlers can be imported without
+    opening a window. Returns the ``tk.Tk`` root.
+    """
+    global root, mode_var, auto_submit_var, mode_buttons
+    global gemini_button, grok_button, status_label, clipboard_poll_id
+
+    # Create the main window
+    root = tk.Tk()
+    root.title("Reddit Comment Scraper")
+    root.geometry("500x310")
+    root.resizable(False, False)
+    root.config(bg="#1e1e1e")
+
+    # Create and pack widgets
+    title_label = tk.Label(
+        root,
+        text="Reddit Comment Chain Scraper",
+        font=("Arial", 14, "bold"),
+        bg="#1e1e1e",
+        fg="#ffffff"
+    )
+    title_label.pack(pady=(20, 10))
+
+    instruction_label = tk.Label(
+        root,
+        text="Press ⌘+V to paste Reddit comment URL",
+        font=("Arial", 11),
+        bg="#1e1e1e",
+        fg="#cccccc"
+    )
+    instruction_label.pack(pady=5)
+
+    # Mode selection with radio buttons
+    mode_var = tk.StringVar(value=DEFAULT_MODE.value)
+
+    mode_frame = tk.Frame(root, bg="#1e1e1e")
+    mode_frame.pack(pady=10)
+
+    # Auto-submit toggle
+    auto_submit_var = tk.BooleanVar(value=True)
+    auto_submit_checkbox = tk.Checkbutton(
+        root,
+        text="Auto-submit with Return key",
+        variable=auto_submit_var,
         font=("Arial", 10),
         bg="#1e1e1e",
-        fg="#ffffff",
+        fg="#cccccc",
         selectcolor="#2d2d2d",
         activebackground="#1e1e1e",
         activeforeground="#ffffff"
     )
-    button.pack(side="left", padx=5)
-    mode_buttons.append(button)
-
-# Action buttons (disabled by default)
-gemini_button = tk.Button(
-    root,
-    text="Open in Gemini 💎",
-    command=open_gemini,
-    font=("Arial", 11, "bold"),
-    bg="#666666",
-    fg="#999999",
-    activebackground="#1557b0",
-    activeforeground="white",
-    relief="flat",
-    borderwidth=0,
-    padx=20,
-    pady=8,
-    cursor="hand2",
-    state="disabled"
-)
-gemini_button.pack(pady=(15, 5))
-
-grok_button = tk.Button(
-    root,
-    text="Open in Grok 🤖",
-    command=open_grok,
-    font=("Arial", 11, "bold"),
-    bg="#666666",
-    fg="#999999",
-    activebackground="#1a73e8",
-    activeforeground="white",
-    relief="flat",
-    borderwidth=0,
-    padx=20,
-    pady=8,
-    cursor="hand2",
-    state="disabled"
-)
-grok_button.pack(pady=5)
-
-# Status label that shows results
-status_label = tk.Label(
-    root,
-    text="Ready - paste URL with ⌘+V",
-    font=("Arial", 12),
-    bg="#1e1e1e",
-    fg="#888888",
-    wraplength=350,
-    justify="left"
-)
-status_label.pack(pady=(15, 20), padx=20)
+    auto_submit_checkbox.pack(pady=5)
+
+    # Keep references alive mainly for future customisation (tooltips, styling).
+    mode_buttons = []
+    for mode in MODE_UI_ORDER:
+        button = tk.Radiobutton(
+            mode_frame,
+            text=mode.ui_label,
+            variable=mode_var,
+            value=mode.value,
+            font=("Arial", 10),
+            bg="#1e1e1e",
+            fg="#ffffff",
+            selectcolor="#2d2d2d",
+            activebackground="#1e1e1e",
+            activeforeground="#ffffff"
+        )
+        button.pack(side="left", padx=5)
+        mode_buttons.append(button)
+
+    # Action buttons (disabled by default)
+    gemini_button = tk.Button(
+        root,
+        text="Open in Gemini 💎",
+        command=open_gemini,
+        font=("Arial", 11, "bold"),
+        bg="#666666",
+        fg="#999999",
+        activebackground="#1557b0",
+        activeforeground="white",
+        relief="flat",
+        borderwidth=0,
+        padx=20,
+        pady=8,
+        cursor="hand2",
+        state="disabled"
+    )
+    gemini_button.pack(pady=(15, 5))
+
+    grok_button = tk.Button(
+        root,
+        text="Open in Grok 🤖",
+        command=open_grok,
+        font=("Arial", 11, "bold"),
+        bg="#666666",
+        fg="#999999",
+        activebackground="#1a73e8",
+        activeforeground="white",
+        relief="flat",
+        borderwidth=0,
+        padx=20,
+        pady=8,
+        cursor="hand2",
+        state="disabled"
+    )
+    grok_button.pack(pady=5)
+
+    # Status label that shows results
+    status_label = tk.Label(
+        root,
+        text="Ready - paste URL with ⌘+V",
+        font=("Arial", 12),
+        bg="#1e1e1e",
+        fg="#888888",
+        wraplength=350,
+        justify="left"
+    )
+    status_label.pack(pady=(15, 20), padx=20)
+
+    # Bind CMD+V (Mac) and CTRL+V (Windows/Linux) to handle paste
+    root.bind('<Command-v>', handle_paste)
+    root.bind('<Control-v>', handle_paste)
+    root.bind('<FocusIn>', wake_clipboard_poll)
+    root.protocol("WM_DELETE_WINDOW", on_close)
+    clipboard_poll_id = root.after(CLIPBOARD_POLL_MS, poll_clipboard)
+
+    return root
+
+
+def main():
+    """Build the GUI and run the Tk event loop."""
+    build_ui()
+    root.mainloop()
+
+    # The window is gone; wait out any running fetch (bounded by the request
+    # timeout and retries) before releasing its pooled connections
+    _FETCH_EXECUTOR.shutdown(wait=True)
+    close_session()
 
-# Bind CMD+V (Mac) and CTRL+V (Windows/Linux) to handle paste
-root.bind('<Command-v>', handle_paste)
-root.bind('<Control-v>', handle_paste)
 
 # Start the GUI only if run directly
 if __name__ == "__main__":
-    root.mainloop()
+    main()
@@ -1,3 +1,6 @@
+import sys
+from itertools import islice
+
 import pyperclip
 from scraper_utils import get_comment_chain
 
@@ -15,19 +18,21 @@ if __name__ == "__main__":
 
         # Print truncated test output
         print("=== CONVERSATION PREVIEW ===\n")
-        for i, comment in enumerate(conversation[:10]):  # Show first 10 comments
+        total = len(conversation)
+        preview = []
+        for i, comment in enumerate(islice(conversation, 10)):  # Show first 10 comments
             # Truncate long comments for display, but show more for the post
             if i == 0:  # First item is the post, show more to include link
                 truncated = comment if len(comment) <= 500 else comment[:497] + "..."
             else:
                 truncated = comment if len(comment) <= 100 else comment[:97] + "..."
-            print(truncated)
-            print()  # Add blank line between items
+            preview.append(f"{truncated}\n\n")  # Blank line between items
+        sys.stdout.write("".join(preview))
 
-        if len(conversation) > 10:
-            print(f"\n... ({len(conversation) - 10} more comments)")
+        if total > 10:
+            print(f"\n... ({total - 10} more comments)")
 
-        print(f"\n=== TOTAL: {len(conversation)} comments ===\n")
+        print(f"\n=== TOTAL: {total} comments ===\n")
 
         # Copy full conversation to clipboard
         full_text = '\n\n'.join(conversation)
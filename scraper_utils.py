@@ -1,7 +1,17 @@
+from operator import itemgetter
 import os
 import re
+import time
+from typing import NamedTuple, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # orjson decodes large Reddit payloads noticeably faster when installed
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    from json import loads as _json_loads
 
 from modes import (
     DEFAULT_MODE,
@@ -11,34 +21,79 @@ from modes import (
 )
 
 
-def load_llm_prompt(mode: str = DEFAULT_MODE.value) -> str:
-    """Load the LLM prompt from the text file and adjust for the selected mode.
+# Set a user agent to avoid being blocked
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+REQUEST_TIMEOUT = (3.05, 10)  # (connect, read) seconds; fail fast on a dead host
 
-    The returned prompt is identical to the previous behaviour—we simply marshal
-    the configuration through a shared lookup so future modes stay consistent.
 
-    Args:
-        mode: String representation of the mode selected in the GUI.
+def _build_session() -> requests.Session:
+    """Create the pooled session shared by every Reddit request."""
+    session = requests.Session()
+    # requests already asks for compressed, keep-alive responses by default
+    session.headers['User-Agent'] = _USER_AGENT
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,  # let raise_for_status report the final response
+    )
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+    return session
+
+
+# Reused across calls so repeat fetches skip the TCP/TLS handshake
+_SESSION = _build_session()
+
+
+def close_session() -> None:
+    """Release pooled connections, e.g. when the GUI window closes."""
+    _SESSION.close()
+
+
+_PROMPT_PATH = os.path.join(os.path.dirname(__file__), 'llm_prompt.txt')
+
+# Captures the placeholder name so ``re.split`` alternates literal text and names.
+_PLACEHOLDER_TOKEN_RE = re.compile(
+    "{{(" + "|".join(re.escape(placeholder) for placeholder in PROMPT_PLACEHOLDERS) + ")}}"
+)
+# Any ``{{NAME}}`` left over after substitution.
+_UNRESOLVED_PLACEHOLDER_RE = re.compile(r"{{\s*([\w_]+)\s*}}")
+_EXPECTED_TOKENS = frozenset(f"{{{{{placeholder}}}}}" for placeholder in PROMPT_PLACEHOLDERS)
+
+
+def _compile_prompt_template() -> Tuple[str, ...]:
+    """Read ``llm_prompt.txt`` and split it around its placeholders.
+
+    Even indices of the returned tuple hold literal template text and odd
+    indices hold the placeholder name that fills the gap between them.
     """
-    prompt_path = os.path.join(os.path.dirname(__file__), 'llm_prompt.txt')
-    with open(prompt_path, 'r') as f:
+    with open(_PROMPT_PATH, 'r') as f:
         template = f.read()
 
-    mode_enum = Mode.from_value(mode)
-    replacements = get_prompt_config(mode_enum)
-
-    expected_tokens = {f"{{{{{placeholder}}}}}" for placeholder in PROMPT_PLACEHOLDERS}
-    missing_tokens = sorted(token for token in expected_tokens if token not in template)
+    missing_tokens = sorted(token for token in _EXPECTED_TOKENS if token not in template)
     if missing_tokens:  # pragma: no cover - signals template drift during development
         raise ValueError(
             "Prompt template is missing expected placeholders: " + ", ".join(missing_tokens)
         )
 
-    prompt = template
-    for placeholder, value in replacements.items():
-        prompt = prompt.replace(f"{{{{{placeholder}}}}}", value)
+    return tuple(_PLACEHOLDER_TOKEN_RE.split(template))
+
+
+# Read and validated at import, so a broken template fails on startup rather
+# than on the first paste.
+_TEMPLATE_SEGMENTS = _compile_prompt_template()
 
-    unresolved = re.findall(r"{{\s*([\w_]+)\s*}}", prompt)
+
+def _render_prompt(mode: Mode) -> str:
+    """Fill every template placeholder with the configuration for ``mode``."""
+    replacements = get_prompt_config(mode)
+
+    prompt = "".join(
+        segment if index % 2 == 0 else replacements[segment]
+        for index, segment in enumerate(_TEMPLATE_SEGMENTS)
+    )
+
+    unresolved = _UNRESOLVED_PLACEHOLDER_RE.findall(prompt)
     if unresolved:  # pragma: no cover - defensive guard
         raise ValueError(
             "Prompt template contains unresolved placeholders: " + ", ".join(sorted(set(unresolved)))
@@ -47,43 +102,173 @@ def load_llm_prompt(mode: str = DEFAULT_MODE.value) -> str:
     return prompt
 
 
-def get_comment_chain(url, mode: str = DEFAULT_MODE.value):
-    """Scrape the comment chain from Reddit and return formatted text.
+# There are only a handful of modes, so render them all up front.
+_RENDERED_PROMPTS = {mode: _render_prompt(mode) for mode in Mode}
+
+
+def load_llm_prompt(mode: str = DEFAULT_MODE.value) -> str:
+    """Return the LLM prompt for the selected mode.
+
+    Every mode's prompt is rendered from ``llm_prompt.txt`` once at import, so
+    this is a lookup in ``_RENDERED_PROMPTS``; the text is unchanged from
+    rendering it on demand.
+
+    Args:
+        mode: String representation of the mode selected in the GUI.
+    """
+    return _RENDERED_PROMPTS[Mode.from_value(mode)]
+
+
+# Fields read from every comment in the chain, fetched in one call
+_COMMENT_FIELDS = itemgetter('id', 'author', 'body')
+
+# Deepest reply level the chain walk follows, so a malformed payload can't
+# keep it going indefinitely
+MAX_CHAIN_DEPTH = 50
+
+
+class RedditThread(NamedTuple):
+    """The parts of a Reddit thread that end up in the conversation.
+
+    Comment authors and bodies are stored as parallel tuples, in chain order,
+    so a cached thread holds only these strings rather than the whole JSON.
+    """
+
+    post_author: str
+    post_title: str
+    post_body: str
+    post_url: str
+    comment_authors: Tuple[str, ...]
+    comment_bodies: Tuple[str, ...]
+
+
+def parse_comment_thread(data, target_comment_id=None) -> RedditThread:
+    """Extract the post and the comment chain from a Reddit JSON payload.
+
+    Args:
+        data: Parsed JSON from a comment permalink's ``.json`` endpoint
+        target_comment_id: ID of the linked comment; the chain stops there
+    """
+
+    # Extract the comment thread
+    # data[0] is the post listing, data[1] is the comments listing
+    post_listing = data[0]
+    comments_listing = data[1]
+    post_data = post_listing['data']['children'][0]['data']
+
+    authors = []
+    bodies = []
+    add_author = authors.append
+    add_body = bodies.append
+
+    # Walk down the reply chain, taking the first comment at each level, up to
+    # and including the linked comment
+    comment_list = comments_listing['data']['children']
+    depth = 0
+    while comment_list and depth <= MAX_CHAIN_DEPTH:
+        # Only process the first comment in each level (the direct chain)
+        item = next((item for item in comment_list if item['kind'] == 't1'), None)
+        if item is None:  # Only "load more" stubs at this level
+            break
+
+        comment = item['data']
+        comment_id, author, body = _COMMENT_FIELDS(comment)
+
+        # Add this comment
+        add_author(author)
+        add_body(body)
+
+        # Check if this is the target comment
+        if target_comment_id and comment_id == target_comment_id:
+            break
+
+        # Follow replies to continue the chain
+        replies = comment.get('replies')
+        if not (replies and isinstance(replies, dict) and 'data' in replies):
+            break
+        comment_list = replies['data'].get('children', [])
+        depth += 1
+
+    return RedditThread(
+        post_author=post_data['author'],
+        post_title=post_data['title'],
+        post_body=post_data.get('selftext', ''),
+        post_url=post_data.get('url', ''),
+        comment_authors=tuple(authors),
+        comment_bodies=tuple(bodies),
+    )
+
+
+# The linked comment's ID in a permalink: .../comment/COMMENT_ID/...
+_COMMENT_ID_RE = re.compile(r'/comment/([^/?]+)')
+
+# Recently fetched threads so re-requesting a link within the TTL skips the network
+THREAD_CACHE_TTL = 60  # seconds
+THREAD_CACHE_MAX_ENTRIES = 32  # oldest entries are evicted beyond this
+_THREAD_CACHE = {}  # url -> (fetched_at, etag, thread), oldest first
+
+
+def _cache_thread(url, etag, thread, fetched_at) -> None:
+    """Store a fetched thread, evicting the oldest entries past the size cap."""
+    _THREAD_CACHE.pop(url, None)  # Re-insert so dict order tracks fetch time
+    _THREAD_CACHE[url] = (fetched_at, etag, thread)
+    while len(_THREAD_CACHE) > THREAD_CACHE_MAX_ENTRIES:
+        del _THREAD_CACHE[next(iter(_THREAD_CACHE))]
+
+
+def fetch_comment_thread(url) -> RedditThread:
+    """Download and parse the comment chain for a Reddit comment link.
+
+    Results are cached per URL for ``THREAD_CACHE_TTL`` seconds; after that the
+    cached copy is revalidated with its ETag, so an unchanged thread costs a
+    bodiless 304 instead of a full download. The thread is independent of the
+    mode, so it can be rendered again with ``build_conversation`` without
+    another request.
 
     Args:
         url: Reddit comment URL
-        mode: One of the supported ``Mode`` values (string form)
     """
 
-    # Normalize the mode early so we fail fast on unexpected strings.
-    mode_value = Mode.from_value(mode).value
+    now = time.monotonic()
+    cached = _THREAD_CACHE.get(url)
+    if cached and now - cached[0] < THREAD_CACHE_TTL:
+        return cached[2]
 
     # Extract comment ID from URL
     # URL format: .../comment/COMMENT_ID/...
-    target_comment_id = None
-    if '/comment/' in url:
-        parts = url.split('/comment/')
-        if len(parts) > 1:
-            target_comment_id = parts[1].split('/')[0].split('?')[0]
-
-    # Add ?context=10000 to get full parent chain
-    base_url = url.split('?')[0]
-    json_url = base_url + '.json?context=10000'
-
-    # Set a user agent to avoid being blocked
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-
-    response = requests.get(json_url, headers=headers)
+    match = _COMMENT_ID_RE.search(url)
+    target_comment_id = match.group(1) if match else None
+
+    # Add ?context=10000 to get full parent chain; raw_json=1 skips Reddit's
+    # legacy HTML escaping of &, < and > in the text fields
+    base_url = url.partition('?')[0]
+    json_url = base_url + '.json?context=10000&raw_json=1'
+
+    headers = {'If-None-Match': cached[1]} if cached and cached[1] else None
+    response = _SESSION.get(json_url, headers=headers, timeout=REQUEST_TIMEOUT)
+    if cached and response.status_code == 304:  # Unchanged since the cached copy
+        _cache_thread(url, cached[1], cached[2], now)
+        return cached[2]
+    if response.status_code == 304:  # Not ours to answer (e.g. a proxy); no body to parse
+        raise requests.HTTPError(f"304 Not Modified with no cached copy of {url}", response=response)
     response.raise_for_status()
 
-    data = response.json()
+    data = _json_loads(response.content)
+
+    thread = parse_comment_thread(data, target_comment_id)
+    _cache_thread(url, response.headers.get('ETag'), thread, now)
+    return thread
 
-    # Extract the comment thread
-    # data[0] is the post, data[1] is the comments
-    post_data = data[0]['data']['children'][0]['data']
-    comments_data = data[1]['data']['children']
+
+def build_conversation(thread: RedditThread, mode: str = DEFAULT_MODE.value):
+    """Format a thread from ``fetch_comment_thread`` as the conversation list.
+
+    Args:
+        thread: Parsed thread as returned by ``fetch_comment_thread``
+        mode: One of the supported ``Mode`` values (string form)
+    """
+
+    mode_value = Mode.from_value(mode).value
 
     # Build the conversation chain
     conversation = []
@@ -92,62 +277,38 @@ def get_comment_chain(url, mode: str = DEFAULT_MODE.value):
     instructions = load_llm_prompt(mode=mode_value)
     conversation.append(instructions)
 
-    # Add the original post first
-    post_author = post_data['author']
-    post_title = post_data['title']
-    post_body = post_data.get('selftext', '')
-    post_url = post_data.get('url', '')
-
-    # Build post content
-    post_content = f"REDDIT POST:\n{post_author}: {post_title}"
+    # Build post content from its parts and join once
+    post_parts = [f"REDDIT POST:\n{thread.post_author}: {thread.post_title}"]
 
-    if post_body:
-        post_content += f"\n\n{post_body}"
+    if thread.post_body:
+        post_parts.append(thread.post_body)
 
     # Add link if it exists and it's an external link (not reddit comments page)
-    if post_url and '/comments/' not in post_url:
-        post_content += f"\n\nLink: {post_url}"
+    if thread.post_url and '/comments/' not in thread.post_url:
+        post_parts.append(f"Link: {thread.post_url}")
 
-    conversation.append(post_content)
+    conversation.append("\n\n".join(post_parts))
 
     # Add comment section header
     conversation.append("COMMENT SECTION:")
 
-    # Flag to stop extraction once we hit the target comment
-    found_target = [False]
-
-    def extract_chain(comment_list, depth=0):
-        """Extract parent chain up to and including the linked comment."""
-        if depth > 50 or found_target[0]:  # Stop if we found target or hit depth limit
-            return
-
-        for item in comment_list:
-            if item['kind'] != 't1':  # Skip if not a comment
-                continue
-
-            comment = item['data']
-            comment_id = comment['id']
-            author = comment['author']
-            body = comment['body']
+    conversation.extend(
+        f"{author}: {body}"
+        for author, body in zip(thread.comment_authors, thread.comment_bodies)
+    )
 
-            # Add this comment
-            conversation.append(f"{author}: {body}")
+    return conversation
 
-            # Check if this is the target comment
-            if target_comment_id and comment_id == target_comment_id:
-                found_target[0] = True
-                return
 
-            # Follow replies to continue the chain
-            replies = comment.get('replies')
-            if replies and isinstance(replies, dict) and 'data' in replies:
-                children = replies['data'].get('children', [])
-                if children:
-                    extract_chain(children, depth + 1)
+def get_comment_chain(url, mode: str = DEFAULT_MODE.value):
+    """Scrape the comment chain from Reddit and return formatted text.
 
-            # Only process the first comment in each level (the direct chain)
-            break
+    Args:
+        url: Reddit comment URL
+        mode: One of the supported ``Mode`` values (string form)
+    """
 
-    extract_chain(comments_data)
+    # Normalize the mode early so we fail fast on unexpected strings.
+    mode_value = Mode.from_value(mode).value
 
-    return conversation
+    return build_conversation(fetch_comment_thread(url), mode=mode_value)
@@ -1,10 +1,8 @@
 #!/usr/bin/env python3
 """Test script for the Gemini integration."""
 
+import os
 import sys
-import time
-import subprocess
-import pyperclip
 
 print("=" * 60)
 print("GEMINI INTEGRATION TEST")
@@ -25,41 +23,43 @@ print(f"  Preview: {full_text[:100]}...")
 
 # Test 2: Copy to clipboard
 print("\n[TEST 2] Copying conversation to clipboard...")
+import pyperclip  # Deferred so the banner prints before the clipboard backend loads
 pyperclip.copy(full_text)
-clipboard_content = pyperclip.paste()
-if clipboard_content == full_text:
-    print("✓ Successfully copied to clipboard")
-    print(f"  Clipboard length: {len(clipboard_content)} characters")
+# Reading it back forks pbpaste, so only do it when asked to
+if os.environ.get("VERIFY_CLIPBOARD"):
+    clipboard_content = pyperclip.paste()
+    if clipboard_content == full_text:
+        print("✓ Successfully copied to clipboard")
+        print(f"  Clipboard length: {len(clipboard_content)} characters")
+    else:
+        print("✗ Clipboard content doesn't match!")
+        sys.exit(1)
 else:
-    print("✗ Clipboard content doesn't match!")
-    sys.exit(1)
-
-# Test 3: Check if Safari is running
-print("\n[TEST 3] Checking Safari status...")
-try:
-    result = subprocess.run(
-        ['osascript', '-e', 'tell application "System Events" to (name of processes) contains "Safari"'],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-    safari_running = result.stdout.strip() == "true"
-    print(f"  Safari running: {safari_running}")
-except Exception as e:
-    print(f"✗ Error checking Safari status: {e}")
-    safari_running = False
+    print("✓ Copied to clipboard (set VERIFY_CLIPBOARD=1 to read it back)")
 
-# Test 4: Execute AppleScript to open Gemini
-print("\n[TEST 4] Executing AppleScript to open Safari and Gemini...")
+# Test 3: Execute AppleScript to open Gemini
+# One osascript run checks Safari, opens Gemini, pastes, and reports the
+# resulting Safari state, instead of forking osascript three times
+print("\n[TEST 3] Executing AppleScript to open Safari and Gemini...")
+import subprocess
 print("  This will:")
+print("  - Check whether Safari is already running")
 print("  - Activate Safari")
 print("  - Create new tab (or window if none exist)")
 print("  - Navigate to gemini.google.com")
 print("  - Wait 2 seconds")
 print("  - Paste the conversation with CMD+V")
+print("  - Report the Safari window count and URL")
 print()
 
 applescript = '''
+-- The status checks report errors in the result instead of failing the script
+try
+    tell application "System Events" to set safariWasRunning to ((name of processes) contains "Safari") as text
+on error errMsg
+    set safariWasRunning to "error: " & errMsg
+end try
+
 tell application "Safari"
     activate
     if (count of windows) = 0 then
@@ -84,7 +84,20 @@ tell application "System Events"
     end tell
 end tell
 
-return "Success"
+try
+    tell application "Safari"
+        set windowCount to count of windows
+        if windowCount > 0 then
+            set safariState to "Windows: " & windowCount & ", URL: " & (URL of front document)
+        else
+            set safariState to "No windows open"
+        end if
+    end tell
+on error errMsg
+    set safariState to "error: " & errMsg
+end try
+
+return safariWasRunning & linefeed & safariState
 '''
 
 try:
@@ -97,7 +110,11 @@ try:
         timeout=10
     )
     print(f"✓ AppleScript executed successfully")
-    print(f"  Return value: {result.stdout.strip()}")
+    safari_running, _, safari_state = result.stdout.strip().partition("\n")
+    if safari_running.startswith("error: "):
+        print(f"✗ Error checking Safari status: {safari_running[len('error: '):]}")
+    else:
+        print(f"  Safari was running: {safari_running == 'true'}")
     if result.stderr:
         print(f"  AppleScript log: {result.stderr.strip()}")
 except subprocess.TimeoutExpired:
@@ -130,29 +147,12 @@ except Exception as e:
     traceback.print_exc()
     sys.exit(1)
 
-# Test 5: Verify Safari window
-print("\n[TEST 5] Verifying Safari state...")
-try:
-    check_script = '''
-    tell application "Safari"
-        set windowCount to count of windows
-        if windowCount > 0 then
-            set currentURL to URL of front document
-            return "Windows: " & windowCount & ", URL: " & currentURL
-        else
-            return "No windows open"
-        end if
-    end tell
-    '''
-    result = subprocess.run(
-        ['osascript', '-e', check_script],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-    print(f"✓ Safari verification: {result.stdout.strip()}")
-except Exception as e:
-    print(f"✗ Could not verify Safari state: {e}")
+# Test 4: Verify Safari window
+print("\n[TEST 4] Verifying Safari state...")
+if safari_state.startswith("error: "):
+    print(f"✗ Could not verify Safari state: {safari_state[len('error: '):]}")
+else:
+    print(f"✓ Safari verification: {safari_state}")
 
 print("\n" + "=" * 60)
 print("TEST COMPLETED SUCCESSFULLY!")
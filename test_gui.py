@@ -2,7 +2,6 @@
 """Test script that simulates clicking the button and auto-closes after success."""
 
 import sys
-import os
 
 # First test the core function
 print("=== Testing core function first ===")
@@ -21,32 +20,34 @@ except Exception as e:
     sys.exit(1)
 
 # Now test the GUI
-import tkinter as tk
-import threading
 import time
 
 import reddit_gui
 
-test_complete = False
+reddit_gui.build_ui()
+
+RESULT_TIMEOUT = 5  # seconds to wait for the fetch to finish
+RESULT_POLL_MS = 100
 
 def auto_click():
-    """Set clipboard and trigger focus event."""
-    time.sleep(0.3)
+    """Set clipboard and trigger the paste handler."""
     print("\n=== Testing GUI ===")
     # Set clipboard with test URL
     test_url = "https://www.reddit.com/r/science/comments/1nu94z4/comment/nh05i30/"
     reddit_gui.root.clipboard_clear()
     reddit_gui.root.clipboard_append(test_url)
     print(f"Clipboard set to: {test_url}")
-    print("Triggering focus event...")
-    reddit_gui.root.event_generate('<FocusIn>')
-
-def check_result():
-    """Check if test completed."""
-    time.sleep(5)
-    global test_complete
-    test_complete = True
+    print("Triggering paste...")
+    reddit_gui.handle_paste()
+    reddit_gui.root.after(RESULT_POLL_MS, check_result, time.monotonic() + RESULT_TIMEOUT)
+
+def check_result(deadline):
+    """Finish as soon as the status reports success, or give up at ``deadline``."""
     status_text = reddit_gui.status_label.cget('text')
+    if "Success" not in status_text and time.monotonic() < deadline:
+        reddit_gui.root.after(RESULT_POLL_MS, check_result, deadline)
+        return
+
     print(f"\nFinal status: {status_text}")
     if "Success" in status_text:
         print("\n=== TEST PASSED ===")
@@ -54,8 +55,8 @@ def check_result():
         print("\n=== TEST FAILED ===")
     reddit_gui.root.quit()
 
-threading.Thread(target=auto_click, daemon=True).start()
-threading.Thread(target=check_result, daemon=True).start()
+# Everything runs on the Tk loop, so no widget is touched from another thread
+reddit_gui.root.after(300, auto_click)
 
 reddit_gui.root.mainloop()
 sys.exit(0)
@@ -1,13 +1,15 @@
 import re
 
-import pytest
-
 from modes import Mode
 from scraper_utils import load_llm_prompt
 
+_PLACEHOLDER_RE = re.compile(r"{{\s*([\w_]+)\s*}}")
+
 
-@pytest.mark.parametrize("mode", [mode.value for mode in Mode])
-def test_prompt_has_no_placeholders_remaining(mode: str) -> None:
-    prompt = load_llm_prompt(mode=mode)
-    leftovers = re.findall(r"{{\s*([\w_]+)\s*}}", prompt)
-    assert not leftovers, f"Unresolved placeholders for mode '{mode}': {leftovers}"
+def test_prompt_has_no_placeholders_remaining() -> None:
+    leftovers = {}
+    for mode in Mode:
+        unresolved = _PLACEHOLDER_RE.findall(load_llm_prompt(mode=mode.value))
+        if unresolved:
+            leftovers[mode.value] = unresolved
+    assert not leftovers, f"Unresolved placeholders by mode: {leftovers}"
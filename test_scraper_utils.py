@@ -0,0 +1,158 @@
+import json
+
+import pytest
+import requests
+
+import scraper_utils
+from modes import Mode
+from scraper_utils import (
+    MAX_CHAIN_DEPTH,
+    THREAD_CACHE_MAX_ENTRIES,
+    THREAD_CACHE_TTL,
+    build_conversation,
+    fetch_comment_thread,
+    load_llm_prompt,
+    parse_comment_thread,
+)
+
+URL = "https://www.reddit.com/r/test/comments/abc/title/"
+
+
+def _comment(comment_id: str, author: str, body: str, replies=None) -> dict:
+    return {
+        "kind": "t1",
+        "data": {
+            "id": comment_id,
+            "author": author,
+            "body": body,
+            "replies": {"kind": "Listing", "data": {"children": replies}} if replies else "",
+        },
+    }
+
+
+def _payload() -> list:
+    post = {
+        "kind": "t3",
+        "data": {
+            "author": "op",
+            "title": "Post title",
+            "selftext": "Post body",
+            "url": "https://example.com/article",
+        },
+    }
+    chain = _comment(
+        "c1",
+        "alice",
+        "first",
+        [
+            _comment(
+                "c2",
+                "bob",
+                "second",
+                [{"kind": "more", "data": {}}, _comment("c3", "carol", "third")],
+            ),
+            _comment("s1", "sibling", "not in the chain"),
+        ],
+    )
+    return [
+        {"kind": "Listing", "data": {"children": [post]}},
+        {"kind": "Listing", "data": {"children": [chain]}},
+    ]
+
+
+def test_conversation_follows_first_reply_chain() -> None:
+    conversation = build_conversation(parse_comment_thread(_payload()))
+    assert conversation == [
+        load_llm_prompt(),
+        "REDDIT POST:\nop: Post title\n\nPost body\n\nLink: https://example.com/article",
+        "COMMENT SECTION:",
+        "alice: first",
+        "bob: second",
+        "carol: third",
+    ]
+
+
+def test_conversation_stops_at_target_comment() -> None:
+    thread = parse_comment_thread(_payload(), target_comment_id="c2")
+    assert thread.comment_authors == ("alice", "bob")
+    assert build_conversation(thread)[3:] == ["alice: first", "bob: second"]
+
+
+def test_conversation_uses_mode_instructions() -> None:
+    conversation = build_conversation(parse_comment_thread(_payload()), mode=Mode.AGREE.value)
+    assert conversation[0] == load_llm_prompt(mode=Mode.AGREE.value)
+
+
+def test_chain_walk_is_capped_at_max_depth() -> None:
+    chain = _comment("deepest", "last", "bottom")
+    for depth in range(MAX_CHAIN_DEPTH + 10):
+        chain = _comment(f"d{depth}", f"user{depth}", "reply", [chain])
+    data = _payload()
+    data[1]["data"]["children"] = [chain]
+    assert len(parse_comment_thread(data).comment_authors) == MAX_CHAIN_DEPTH + 1
+
+
+class _Response:
+    def __init__(self, status_code=200, etag=None) -> None:
+        self.status_code = status_code
+        self.headers = {"ETag": etag} if etag else {}
+        self.content = json.dumps(_payload()).encode() if status_code == 200 else b""
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise AssertionError(f"unexpected status {self.status_code}")
+
+
+class _StubSession:
+    """Stands in for ``scraper_utils._SESSION``; ``get`` returns ``responses`` in order."""
+
+    def __init__(self) -> None:
+        self.responses = []
+        self.requests = []
+        self.now = 1000.0  # what time.monotonic() returns
+
+    def get(self, url, headers=None, timeout=None) -> _Response:
+        self.requests.append((url, headers))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def session(monkeypatch) -> _StubSession:
+    stub = _StubSession()
+    monkeypatch.setattr(scraper_utils, "_SESSION", stub)
+    monkeypatch.setattr(scraper_utils, "_THREAD_CACHE", {})
+    monkeypatch.setattr(scraper_utils.time, "monotonic", lambda: stub.now)
+    return stub
+
+
+def test_cache_hit_within_ttl_skips_request(session) -> None:
+    session.responses = [_Response(etag='"v1"')]
+    first = fetch_comment_thread(URL)
+    session.now += THREAD_CACHE_TTL - 1
+    assert fetch_comment_thread(URL) is first
+    assert len(session.requests) == 1
+
+
+def test_expired_entry_revalidates_with_etag(session) -> None:
+    session.responses = [_Response(etag='"v1"'), _Response(status_code=304)]
+    first = fetch_comment_thread(URL)
+    session.now += THREAD_CACHE_TTL + 1
+    assert fetch_comment_thread(URL) is first
+    assert session.requests[1][1] == {"If-None-Match": '"v1"'}
+
+
+def test_304_without_cache_entry_is_reported(session) -> None:
+    session.responses = [_Response(status_code=304)]
+    with pytest.raises(requests.HTTPError, match="no cached copy"):
+        fetch_comment_thread(URL)
+    assert session.requests[0][1] is None
+
+
+def test_oldest_entry_is_evicted_past_max_entries(session) -> None:
+    urls = [f"{URL}{i}/" for i in range(THREAD_CACHE_MAX_ENTRIES + 1)]
+    session.responses = [_Response() for _ in urls]
+    for url in urls:
+        fetch_comment_thread(url)
+    assert len(scraper_utils._THREAD_CACHE) == THREAD_CACHE_MAX_ENTRIES
+    assert urls[0] not in scraper_utils._THREAD_CACHE
+    assert urls[-1] in scraper_utils._THREAD_CACHE